@@ -559,9 +559,9 @@ class Bin:
             # No terminator found, just return what we have
             return b
 
-    def read(self, vaddr: int, size: int) -> Optional[bytes]:
-        """Read (at most) the given number of bytes at the given virtual address.
-        If we return None, the given address points to uninitialized data."""
+    def read_view(self, vaddr: int, size: int) -> Optional[memoryview]:
+        """Same as read() but returns a view into the section data
+        instead of a copy of the bytes."""
         (section_id, offset) = self.get_relative_addr(vaddr)
         section = self.sections[section_id - 1]
 
@@ -571,4 +571,13 @@ class Bin:
         # Clamp the read within the extent of the current section.
         # Reading off the end will most likely misrepresent the virtual addressing.
         _size = min(size, section.size_of_raw_data - offset)
-        return bytes(section.view[offset : offset + _size])
+        return section.view[offset : offset + _size]
+
+    def read(self, vaddr: int, size: int) -> Optional[bytes]:
+        """Read (at most) the given number of bytes at the given virtual address.
+        If we return None, the given address points to uninitialized data."""
+        view = self.read_view(vaddr, size)
+        if view is None:
+            return None
+
+        return bytes(view)
@@ -66,7 +66,7 @@ class DecompLinter:
                 if is_string:
                     self._strings[value] = marker.name
 
-    def _check_function_order(self):
+    def _check_function_order(self, parser: DecompParser):
         """Rules:
         1. Only markers that are implemented in the file are considered. This means we
         only look at markers that are cross-referenced with cvdump output by their line
@@ -84,7 +84,7 @@ class DecompLinter:
 
         checkorder_filter = get_checkorder_filter(self._module)
         last_offset = None
-        for fun in filter(checkorder_filter, self._parser.functions):
+        for fun in filter(checkorder_filter, parser.functions):
             if last_offset is not None:
                 if fun.offset < last_offset:
                     self.alerts.append(
@@ -96,17 +96,17 @@ class DecompLinter:
 
             last_offset = fun.offset
 
-    def _check_offset_uniqueness(self):
-        self._load_offsets_from_list(self._parser.functions)
-        self._load_offsets_from_list(self._parser.vtables)
-        self._load_offsets_from_list(self._parser.variables)
-        self._load_offsets_from_list(self._parser.strings)
+    def _check_offset_uniqueness(self, parser: DecompParser):
+        self._load_offsets_from_list(parser.functions)
+        self._load_offsets_from_list(parser.vtables)
+        self._load_offsets_from_list(parser.variables)
+        self._load_offsets_from_list(parser.strings)
 
-    def _check_byname_allowed(self):
+    def _check_byname_allowed(self, parser: DecompParser):
         if self.file_is_header():
             return
 
-        for fun in self._parser.functions:
+        for fun in parser.functions:
             if fun.lookup_by_name:
                 self.alerts.append(
                     ParserAlert(
@@ -126,15 +126,30 @@ class DecompLinter:
         self._parser.read_lines(lines)
 
         self._parser.finish()
-        self.alerts = self._parser.alerts[::]
+        return self._run_checks(self._parser)
 
-        self._check_offset_uniqueness()
+    def check_parser(self, parser: DecompParser, filename, module=None):
+        """Same as check_lines, but for a parser that has already read
+        the entire compilation unit. This lets the caller do the parsing
+        elsewhere (i.e. in another process) while the offset checks that
+        span multiple files still happen here."""
+
+        self.reset(False)
+        self._filename = filename
+        self._module = module
+
+        return self._run_checks(parser)
+
+    def _run_checks(self, parser: DecompParser):
+        self.alerts = parser.alerts[::]
+
+        self._check_offset_uniqueness(parser)
 
         if self._module is not None:
-            self._check_byname_allowed()
+            self._check_byname_allowed(parser)
 
             if not self.file_is_header():
-                self._check_function_order()
+                self._check_function_order(parser)
 
         return len(self.alerts) == 0
 
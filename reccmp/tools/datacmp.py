@@ -2,22 +2,23 @@
 
 import os
 import argparse
+import functools
 import logging
+import queue
+import threading
+from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, List, NamedTuple, Optional, Tuple
-from struct import unpack
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+from struct import Struct
 import colorama
 import reccmp
-from reccmp.isledecomp.compare import Compare as IsleCompare
-from reccmp.isledecomp.compare.db import MatchInfo
-from reccmp.isledecomp.cvdump import Cvdump
-from reccmp.isledecomp.cvdump.types import (
-    CvdumpKeyError,
-    CvdumpIntegrityError,
-)
-from reccmp.isledecomp.bin import Bin as IsleBin
 
-colorama.just_fix_windows_console()
+# The compare and cvdump modules take a while to import.
+# Only load them once we know we are going to run the comparison.
+if TYPE_CHECKING:
+    from reccmp.isledecomp.bin import Bin as IsleBin
+    from reccmp.isledecomp.compare.db import MatchInfo
+    from reccmp.isledecomp.cvdump.parser import GdataEntry
 
 
 # Ignore all compare-db messages.
@@ -88,7 +89,8 @@ class CompareResult(Enum):
     WARN = 4
 
 
-class ComparedOffset(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class ComparedOffset:
     offset: int
     # name is None for scalar types
     name: Optional[str]
@@ -96,7 +98,8 @@ class ComparedOffset(NamedTuple):
     values: Tuple[str, str]
 
 
-class ComparisonItem(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class ComparisonItem:
     """Each variable that was compared"""
 
     orig_addr: int
@@ -132,7 +135,7 @@ class ComparisonItem(NamedTuple):
 
 
 def create_comparison_item(
-    var: MatchInfo,
+    var: "MatchInfo",
     compared: Optional[List[ComparedOffset]] = None,
     error: Optional[str] = None,
     raw_only: bool = False,
@@ -151,9 +154,46 @@ def create_comparison_item(
     )
 
 
-def do_the_comparison(args: argparse.Namespace) -> Iterable[ComparisonItem]:
+def pad_to_size(view: memoryview, size: int) -> bytearray:
+    """Copy the view into a zero-filled buffer of the given size."""
+    buf = bytearray(size)
+    buf[: len(view)] = view
+    return buf
+
+
+def get_type_reference(
+    recompfile: "IsleBin", globals_list: List["GdataEntry"]
+) -> Dict[int, str]:
+    """Map the recomp address of each global variable to its type key."""
+
+    # Resolve each section's base address once instead of once per global.
+    section_bases = {
+        section_id: recompfile.get_section_offset_by_index(section_id)
+        for section_id in {g.section for g in globals_list}
+        if recompfile.is_valid_section(section_id)
+    }
+
+    return {
+        section_bases[g.section] + g.offset: g.type
+        for g in globals_list
+        if g.section in section_bases
+    }
+
+
+def do_the_comparison(args: argparse.Namespace) -> Iterator[ComparisonItem]:
     """Run through each variable in our compare DB, then do the comparison
     according to the variable's type. Emit the result."""
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    from reccmp.isledecomp.bin import Bin as IsleBin
+    from reccmp.isledecomp.compare import Compare as IsleCompare
+    from reccmp.isledecomp.cvdump import Cvdump
+    from reccmp.isledecomp.cvdump.types import (
+        CvdumpKeyError,
+        CvdumpIntegrityError,
+        ScalarType,
+        member_list_to_struct_string,
+    )
+
     with IsleBin(args.original, find_str=True) as origfile, IsleBin(
         args.recompiled
     ) as recompfile:
@@ -166,13 +206,39 @@ def do_the_comparison(args: argparse.Namespace) -> Iterable[ComparisonItem]:
         # need the matched symbols to compare pointers (e.g. on strings)
         mini_cvdump = Cvdump(args.pdb).globals().types().run()
 
-        recomp_type_reference = {
-            recompfile.get_abs_addr(g.section, g.offset): g.type
-            for g in mini_cvdump.globals
-            if recompfile.is_valid_section(g.section)
-        }
+        recomp_type_reference = get_type_reference(recompfile, mini_cvdump.globals)
+
+        # Many variables share the same type. Cache the list of scalars,
+        # the compiled struct, and whether any of the scalars is a pointer
+        # for each type we have already seen.
+        type_layouts: Dict[str, Tuple[List[ScalarType], Struct, bool]] = {}
+
+        # Many pointers share the same target (e.g. vtables or strings)
+        # so remember the display text instead of querying the DB each time.
+        @functools.cache
+        def pointer_display(addr: int, is_orig: bool) -> str:
+            """Helper to streamline pointer textual display."""
+            if addr == 0:
+                return "nullptr"
+
+            ptr_match = (
+                isle_compare.get_by_orig(addr)
+                if is_orig
+                else isle_compare.get_by_recomp(addr)
+            )
 
-        for var in isle_compare.get_variables():
+            if ptr_match is not None:
+                return f"Pointer to {ptr_match.match_name()}"
+
+            # This variable did not match if we do not have
+            # the pointer target in our DB.
+            return f"Unknown pointer 0x{addr:x}"
+
+        # Visit the variables in address order so we walk through each
+        # section from start to end instead of jumping around.
+        for var in sorted(
+            isle_compare.get_variables(), key=lambda v: (v.orig_addr, v.recomp_addr)
+        ):
             type_name = recomp_type_reference.get(var.recomp_addr)
 
             # Start by assuming we can only compare the raw bytes
@@ -183,14 +249,15 @@ def do_the_comparison(args: argparse.Namespace) -> Iterable[ComparisonItem]:
                 try:
                     # If we are type-aware, we can get the precise
                     # data size for the variable.
-                    data_type = mini_cvdump.types.get(type_name)
-                    data_size = data_type.size
+                    data_size = mini_cvdump.types.get(type_name).size
                 except (CvdumpKeyError, CvdumpIntegrityError) as ex:
                     yield create_comparison_item(var, error=repr(ex))
                     continue
 
-            orig_raw = origfile.read(var.orig_addr, data_size)
-            recomp_raw = recompfile.read(var.recomp_addr, data_size)
+            # Read views into the section data so we only copy the bytes
+            # when we need to keep them around for display.
+            orig_raw = origfile.read_view(var.orig_addr, data_size)
+            recomp_raw = recompfile.read_view(var.recomp_addr, data_size)
 
             # The IMAGE_SECTION_HEADER defines the SizeOfRawData and VirtualSize for the section.
             # If VirtualSize > SizeOfRawData, the section is comprised of the initialized data
@@ -201,10 +268,10 @@ def do_the_comparison(args: argparse.Namespace) -> Iterable[ComparisonItem]:
             # If this happens (i.e. we get an incomplete read) we just do the same padding
             # to prepare for the comparison.
             if orig_raw is not None and len(orig_raw) < data_size:
-                orig_raw = orig_raw.ljust(data_size, b"\x00")
+                orig_raw = pad_to_size(orig_raw, data_size)
 
             if recomp_raw is not None and len(recomp_raw) < data_size:
-                recomp_raw = recomp_raw.ljust(data_size, b"\x00")
+                recomp_raw = pad_to_size(recomp_raw, data_size)
 
             # If one or both variables are entirely uninitialized
             if orig_raw is None or recomp_raw is None:
@@ -215,8 +282,8 @@ def do_the_comparison(args: argparse.Namespace) -> Iterable[ComparisonItem]:
                 # an uninitialized variable, but this may or may not actually
                 # be correct, so we flag it for the user.
                 uninit_force_match = not match and (
-                    (orig_raw is None and all(b == 0 for b in recomp_raw))
-                    or (recomp_raw is None and all(b == 0 for b in orig_raw))
+                    (orig_raw is None and not any(recomp_raw))
+                    or (recomp_raw is None and not any(orig_raw))
                 )
 
                 orig_value = "(uninitialized)" if orig_raw is None else "(initialized)"
@@ -248,7 +315,7 @@ def do_the_comparison(args: argparse.Namespace) -> Iterable[ComparisonItem]:
                             offset=0,
                             name="(raw)",
                             match=orig_raw == recomp_raw,
-                            values=(orig_raw, recomp_raw),
+                            values=(bytes(orig_raw), bytes(recomp_raw)),
                         )
                     ],
                     raw_only=True,
@@ -256,43 +323,45 @@ def do_the_comparison(args: argparse.Namespace) -> Iterable[ComparisonItem]:
                 continue
 
             # If we are here, we can do the type-aware comparison.
-            compared = []
-            compare_items = mini_cvdump.types.get_scalars_gapless(type_name)
-            format_str = mini_cvdump.types.get_format_string(type_name)
-
-            orig_data = unpack(format_str, orig_raw)
-            recomp_data = unpack(format_str, recomp_raw)
-
-            def pointer_display(addr: int, is_orig: bool) -> str:
-                """Helper to streamline pointer textual display."""
-                if addr == 0:
-                    return "nullptr"
-
-                ptr_match = (
-                    isle_compare.get_by_orig(addr)
-                    if is_orig
-                    else isle_compare.get_by_recomp(addr)
+            if type_name not in type_layouts:
+                compare_items = mini_cvdump.types.get_scalars_gapless(type_name)
+                type_layouts[type_name] = (
+                    compare_items,
+                    Struct(member_list_to_struct_string(compare_items)),
+                    any(member.is_pointer for member in compare_items),
                 )
 
-                if ptr_match is not None:
-                    return f"Pointer to {ptr_match.match_name()}"
+            (compare_items, data_struct, has_pointers) = type_layouts[type_name]
+            orig_data = data_struct.unpack(orig_raw)
+            recomp_data = data_struct.unpack(recomp_raw)
 
-                # This variable did not match if we do not have
-                # the pointer target in our DB.
-                return f"Unknown pointer 0x{addr:x}"
+            if not has_pointers:
+                # Plain values only: compare them directly.
+                compared = [
+                    ComparedOffset(
+                        offset=member.offset,
+                        name=member.name,
+                        match=value_a == value_b,
+                        values=(value_a, value_b),
+                    )
+                    for (member, value_a, value_b) in zip(
+                        compare_items, orig_data, recomp_data
+                    )
+                ]
+                yield create_comparison_item(var, compared=compared)
+                continue
 
-            # Could zip here
-            for i, member in enumerate(compare_items):
+            compared = []
+            for member, value_a, value_b in zip(compare_items, orig_data, recomp_data):
                 if member.is_pointer:
-                    match = isle_compare.is_pointer_match(orig_data[i], recomp_data[i])
-
-                    value_a = pointer_display(orig_data[i], True)
-                    value_b = pointer_display(recomp_data[i], False)
-
-                    values = (value_a, value_b)
+                    match = isle_compare.is_pointer_match(value_a, value_b)
+                    values = (
+                        pointer_display(value_a, True),
+                        pointer_display(value_b, False),
+                    )
                 else:
-                    match = orig_data[i] == recomp_data[i]
-                    values = (orig_data[i], recomp_data[i])
+                    match = value_a == value_b
+                    values = (value_a, value_b)
 
                 compared.append(
                     ComparedOffset(
@@ -306,12 +375,44 @@ def do_the_comparison(args: argparse.Namespace) -> Iterable[ComparisonItem]:
             yield create_comparison_item(var, compared=compared)
 
 
+def iter_in_background(items: Iterable[ComparisonItem]) -> Iterator[ComparisonItem]:
+    """Consume the iterable on a worker thread and emit its items here.
+    The comparison can then keep going while we are busy printing.
+    The queue is unbounded so the worker (and the binaries it has open)
+    can finish without waiting for the printing to catch up."""
+    item_queue: queue.Queue = queue.Queue()
+    done = object()
+    error: List[Exception] = []
+
+    def worker():
+        try:
+            for item in items:
+                item_queue.put(item)
+        # pylint: disable=broad-exception-caught
+        # Re-raised on the main thread below.
+        except Exception as ex:
+            error.append(ex)
+        finally:
+            item_queue.put(done)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+
+    while (item := item_queue.get()) is not done:
+        yield item
+
+    thread.join()
+    if error:
+        raise error[0]
+
+
 def value_get(value: Optional[str], default: str):
     return value if value is not None else default
 
 
 def main():
     args = parse_args()
+    colorama.just_fix_windows_console()
 
     def display_match(result: CompareResult) -> str:
         """Helper to return color string or not, depending on user preference"""
@@ -332,7 +433,7 @@ def main():
     var_count = 0
     problems = 0
 
-    for item in do_the_comparison(args):
+    for item in iter_in_background(do_the_comparison(args)):
         var_count += 1
         if item.result in (CompareResult.DIFF, CompareResult.ERROR):
             problems += 1
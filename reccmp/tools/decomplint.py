@@ -3,23 +3,27 @@
 import os
 import sys
 import argparse
+from typing import TYPE_CHECKING, Iterator, List
 import colorama
 import reccmp
-from reccmp.isledecomp.dir import walk_source_dir, is_file_cpp
-from reccmp.isledecomp.parser import DecompLinter
 
-colorama.just_fix_windows_console()
+# Importing the reccmp.isledecomp package pulls in most of the library.
+# Wait until we know we have files to check.
+if TYPE_CHECKING:
+    from reccmp.isledecomp.parser import DecompParser
+
+
+ERROR_PREFIX = f"{colorama.Fore.RED}error: "
+WARNING_PREFIX = f"{colorama.Fore.YELLOW}warning: "
 
 
 def display_errors(alerts, filename):
     sorted_alerts = sorted(alerts, key=lambda a: a.line_number)
 
+    # Write the report for the whole file at once.
+    lines = []
     for alert in sorted_alerts:
-        error_type = (
-            f"{colorama.Fore.RED}error: "
-            if alert.is_error()
-            else f"{colorama.Fore.YELLOW}warning: "
-        )
+        error_type = ERROR_PREFIX if alert.is_error() else WARNING_PREFIX
         components = [
             colorama.Fore.LIGHTWHITE_EX,
             filename,
@@ -30,10 +34,12 @@ def display_errors(alerts, filename):
             colorama.Fore.LIGHTWHITE_EX,
             alert.code.name.lower(),
         ]
-        print("".join(components))
+        lines.append("".join(components))
 
         if alert.line is not None:
-            print(f"{colorama.Fore.WHITE}  {alert.line}")
+            lines.append(f"{colorama.Fore.WHITE}  {alert.line}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -59,19 +65,57 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
+def parse_file(filename: str) -> "DecompParser":
+    """Read the given file with a new parser."""
+    # pylint: disable=import-outside-toplevel
+    from reccmp.isledecomp.parser import DecompParser
+
+    parser = DecompParser()
+    with open(filename, "r", encoding="utf-8") as f:
+        parser.read_lines(f)
+
+    parser.finish()
+    return parser
+
+
+# Starting the process pool has a fixed cost that only pays off
+# if there are enough files to check.
+POOL_MIN_FILES = 64
+
+
+def parse_files(files: List[str]) -> Iterator["DecompParser"]:
+    """Parse each file, in order. Parsing is the expensive part of linting
+    and each file is independent, so spread the work across processes
+    if we have more than one CPU and enough files to make it worthwhile."""
+    if len(files) < POOL_MIN_FILES or (os.cpu_count() or 1) < 2:
+        yield from map(parse_file, files)
+        return
+
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(parse_file, files, chunksize=16)
+
+
 def process_files(files, module=None):
+    # pylint: disable=import-outside-toplevel
+    from reccmp.isledecomp.parser import DecompLinter
+
     warning_count = 0
     error_count = 0
 
+    # The linter remembers the offsets seen in each file, so its checks
+    # must run here, one file at a time, in the original order.
     linter = DecompLinter()
-    for filename in files:
-        success = linter.check_file(filename, module)
+    for filename, parser in zip(files, parse_files(files)):
+        success = linter.check_parser(parser, filename, module)
 
-        warnings = [a for a in linter.alerts if a.is_warning()]
-        errors = [a for a in linter.alerts if a.is_error()]
-
-        error_count += len(errors)
-        warning_count += len(warnings)
+        for alert in linter.alerts:
+            if alert.is_error():
+                error_count += 1
+            elif alert.is_warning():
+                warning_count += 1
 
         if not success:
             display_errors(linter.alerts, filename)
@@ -82,6 +126,10 @@ def process_files(files, module=None):
 
 def main():
     args = parse_args()
+    colorama.just_fix_windows_console()
+
+    # pylint: disable=import-outside-toplevel
+    from reccmp.isledecomp.dir import walk_source_dir, is_file_cpp
 
     files_to_check = []
     if os.path.isdir(args.target):
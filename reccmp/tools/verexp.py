@@ -4,10 +4,94 @@ import argparse
 import difflib
 import subprocess
 import os
+from typing import List
 
 import reccmp
 from reccmp.bin import lib_path_join
-from reccmp.isledecomp.utils import print_diff
+
+
+# The line in the DUMPBIN output right before the list of exports.
+EXPORTS_HEADER = "            ordinal hint   name"
+# The line in the DUMPBIN output before the section for each input file.
+DUMP_OF_FILE = "Dump of file "
+
+
+def get_wine_drive_path(file: str) -> str:
+    """Convert the path into one that programs running under wine can open.
+    Wine maps the unix root directory to drive Z: by default, so we can
+    usually skip starting winepath."""
+    return "Z:" + os.path.abspath(file).replace("/", "\\")
+
+
+def run_dumpbin_exports(files: List[str]) -> List[List[str]]:
+    """Run DUMPBIN once on all of the given files and return the
+    list of exports for each one. The paths must already be in the
+    format DUMPBIN expects (i.e. converted for wine)."""
+    call = [lib_path_join("DUMPBIN.EXE"), "/EXPORTS", *files]
+
+    if os.name != "nt":
+        call.insert(0, "wine")
+
+    results: List[List[str]] = []
+
+    # Read the output as it comes in rather than buffering all of it.
+    with subprocess.Popen(
+        call, stdout=subprocess.PIPE, text=True, encoding="utf-8"
+    ) as proc:
+        exports: List[str] = []
+        start = False
+
+        for raw_line in proc.stdout:
+            line = raw_line.rstrip("\r\n")
+
+            # Each file's section of the output starts with this line.
+            if line.startswith(DUMP_OF_FILE):
+                exports = []
+                results.append(exports)
+                start = False
+            elif not start:
+                if line == EXPORTS_HEADER:
+                    start = True
+            else:
+                if line:
+                    # Drop the undecorated name in parentheses, if any.
+                    (name, sep, _) = line.rpartition("  (")
+                    exports.append((name if sep else line)[27:])
+                elif exports:
+                    # End of the export table for this file.
+                    start = False
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, call)
+
+    if len(results) != len(files):
+        raise ValueError(
+            f"Expected DUMPBIN output for {len(files)} files, got {len(results)}"
+        )
+
+    return results
+
+
+def get_exports(files: List[str]) -> List[List[str]]:
+    """Get the list of exports for each of the given files.
+    DUMPBIN can read all of them in one go, which saves us from
+    starting it (and wine) once per file."""
+    if os.name == "nt":
+        return run_dumpbin_exports(files)
+
+    # Try the Z: drive mapping first unless the user told us not to.
+    # If DUMPBIN cannot read the files that way, the wine prefix probably
+    # does not have the mapping, so fall back to asking winepath.
+    if os.environ.get("RECCMP_USE_WINEPATH") != "1":
+        try:
+            return run_dumpbin_exports([get_wine_drive_path(f) for f in files])
+        except (subprocess.CalledProcessError, ValueError):
+            pass
+
+    # pylint: disable=import-outside-toplevel
+    from reccmp.isledecomp.dir import winepath_unix_to_win
+
+    return run_dumpbin_exports([winepath_unix_to_win(f) for f in files])
 
 
 def main():
@@ -36,38 +120,18 @@ def main():
     if not os.path.isfile(args.recompiled):
         parser.error(f"Recompiled binary {args.recompiled} does not exist")
 
-    def get_exports(file):
-        call = [lib_path_join("DUMPBIN.EXE"), "/EXPORTS"]
-
-        if os.name != "nt":
-            call.insert(0, "wine")
-            file = (
-                subprocess.check_output(["winepath", "-w", file])
-                .decode("utf-8")
-                .strip()
-            )
-
-        call.append(file)
-
-        raw = subprocess.check_output(call).decode("utf-8").split("\r\n")
-        exports = []
-
-        start = False
-
-        for line in raw:
-            if not start:
-                if line == "            ordinal hint   name":
-                    start = True
-            else:
-                if line:
-                    exports.append(line[27 : line.rindex("  (")])
-                elif exports:
-                    break
+    exports = get_exports([args.original, args.recompiled])
+    og_exp = exports[0]
+    re_exp = exports[1]
 
-        return exports
+    # Nothing to report. Skip the (slow) diff.
+    if og_exp == re_exp:
+        return 0
 
-    og_exp = get_exports(args.original)
-    re_exp = get_exports(args.recompiled)
+    # Importing the reccmp.isledecomp package pulls in most of the library,
+    # so wait until we know there is a diff to print.
+    # pylint: disable=import-outside-toplevel
+    from reccmp.isledecomp.utils import print_diff
 
     udiff = difflib.unified_diff(og_exp, re_exp)
     has_diff = print_diff(udiff, args.no_color)
@@ -77,6 +77,11 @@ def test_read_pi(addr: int, binfile: IsleBin):
     assert binfile.read(addr, 8) == DOUBLE_PI_BYTES
 
 
+@pytest.mark.parametrize("addr", PI_ADDRESSES)
+def test_read_view_pi(addr: int, binfile: IsleBin):
+    assert binfile.read_view(addr, 8) == DOUBLE_PI_BYTES
+
+
 def test_unusual_reads(binfile: IsleBin):
     """Reads that return an error or some specific value based on context"""
     # Reading an address earlier than the imagebase
@@ -1,5 +1,5 @@
 import pytest
-from reccmp.isledecomp.parser import DecompLinter
+from reccmp.isledecomp.parser import DecompLinter, DecompParser
 from reccmp.isledecomp.parser.error import ParserError
 
 
@@ -114,6 +114,38 @@ def test_duplicate_offsets(linter):
     assert linter.check_lines(lines, "test.h", "TEST") is True
 
 
+def test_check_parser(linter):
+    """Files parsed elsewhere are still checked for offsets seen in earlier files."""
+    lines = [
+        "// FUNCTION: TEST 0x1000",
+        "// MyClass::~MyClass",
+    ]
+
+    assert linter.check_lines(lines, "test.h", "TEST") is True
+
+    parser = DecompParser()
+    parser.read_lines(lines)
+    parser.finish()
+
+    assert linter.check_parser(parser, "other.h", "TEST") is False
+    assert len(linter.alerts) == 1
+    assert linter.alerts[0].code == ParserError.DUPLICATE_OFFSET
+
+
+def test_check_parser_keeps_caller_parser(linter):
+    """The linter must not reset or reuse the parser it was given."""
+    parser = DecompParser()
+    parser.read_lines(["// FUNCTION: TEST 0x1000", "// MyClass::~MyClass"])
+    parser.finish()
+
+    assert linter.check_parser(parser, "test.h", "TEST") is True
+
+    lines = ["// FUNCTION: TEST 0x2000", "// MyClass::MyClass"]
+    assert linter.check_lines(lines, "other.h", "TEST") is True
+
+    assert [fun.offset for fun in parser.functions] == [0x1000]
+
+
 def test_duplicate_strings(linter):
     """Duplicate string markers are okay if the string value is the same."""
     string_lines = [